@@ -0,0 +1,611 @@
+"""
+backfill.py
+
+pulls historical index data from the coindesk historical endpoints and stores it
+in a compact columnar format on disk that the live tickers can then extend
+"""
+import os
+import shutil
+import struct
+from argparse import ArgumentParser
+from array import array
+from bisect import bisect_left, bisect_right
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime, timezone
+from pathlib import Path
+from threading import Lock, RLock
+from time import sleep
+from typing import Dict, Any, List, Optional, Iterable
+
+from requests import get as r_get, RequestException
+
+from Backend.err import BackfillError, CoinDeskApiError
+from Backend.helpers import CryptoType
+
+
+class HistoricalStore:
+    """
+    Stores price history as one binary file per column, per instrument and unit.
+
+    Layout on disk:
+        <root>/<market>/<instrument>/<unit>/CURRENT
+        <root>/<market>/<instrument>/<unit>/gen-<n>/<COLUMN>.bin
+        <root>/<market>/<instrument>/<unit>/chunks/<from_ts>_<to_ts>.chunk
+
+    Column files are raw arrays (int64 timestamps, float64 prices) so new rows can be
+    appended without rewriting the series. Rewrites go to a new generation directory and
+    only become visible once CURRENT is atomically switched to it, so an interrupted
+    rewrite leaves the previous generation intact. Chunk files hold fetched pages that
+    have not been merged yet; they are what lets an interrupted backfill resume.
+
+    Live ticks are rolled up into bars of live_unit (see append_tick), extending the
+    same series the backfill writes.
+
+    Writes to a series are serialized by a per-series lock, so a store can be shared
+    between threads (e.g. pooled tickers). Across processes, each series must only
+    have one writer.
+    """
+    TIMESTAMP_COLUMN: str = 'TIMESTAMP'
+    PRICE_COLUMNS: List[str] = ['OPEN', 'HIGH', 'LOW', 'CLOSE']
+    COLUMNS: List[str] = [TIMESTAMP_COLUMN, *PRICE_COLUMNS]
+    COLUMN_TYPECODES: Dict[str, str] = {TIMESTAMP_COLUMN: 'q',
+                                        **{col: 'd' for col in PRICE_COLUMNS}}
+    # itemsize of every column type, int64 and float64 alike
+    ITEM_SIZE: int = 8
+
+    UNIT_SECONDS: Dict[str, int] = {
+        'days': 86400,
+        'hours': 3600,
+        'minutes': 60
+    }
+
+    COLUMN_SUFFIX: str = '.bin'
+    CHUNK_SUFFIX: str = '.chunk'
+    CHUNK_DIR_NAME: str = 'chunks'
+    CURRENT_FILE_NAME: str = 'CURRENT'
+    GENERATION_PREFIX: str = 'gen-'
+    # row count header of a chunk file
+    CHUNK_HEADER = struct.Struct('<I')
+
+    DEFAULT_MARKET: str = 'cadli'
+    DEFAULT_UNIT: str = 'days'
+
+    def __init__(self, root_dir: str | Path, market: str = None, live_unit: str = None) -> None:
+        """
+        Args:
+            root_dir: Directory the series are stored in
+            market: CoinDesk index market, defaults to DEFAULT_MARKET
+            live_unit: Unit whose bars live ticks are rolled into, defaults to DEFAULT_UNIT
+        """
+        self.root_dir = Path(root_dir)
+        self.market = market or self.__class__.DEFAULT_MARKET
+        self.live_unit = live_unit or self.__class__.DEFAULT_UNIT
+        self._check_unit(self.live_unit)
+        self._locks_lock = Lock()
+        self._series_locks: Dict[tuple[str, str], RLock] = {}
+        # last stored row per series, so appends and ticks don't re-read the series
+        self._last_rows: Dict[tuple[str, str], Optional[Dict[str, float | int]]] = {}
+
+    @classmethod
+    def _check_unit(cls, unit: str) -> None:
+        if unit not in cls.UNIT_SECONDS:
+            raise ValueError(f"unit must be one of: {', '.join(cls.UNIT_SECONDS)}")
+
+    def series_dir(self, instrument: str, unit: str = None) -> Path:
+        return self.root_dir / self.market / instrument / (unit or self.__class__.DEFAULT_UNIT)
+
+    def chunk_dir(self, instrument: str, unit: str = None) -> Path:
+        return self.series_dir(instrument, unit) / self.__class__.CHUNK_DIR_NAME
+
+    def _chunk_path(self, instrument: str, unit: str, from_ts: int, to_ts: int) -> Path:
+        return self.chunk_dir(instrument, unit) / f"{from_ts}_{to_ts}{self.__class__.CHUNK_SUFFIX}"
+
+    def _series_lock(self, instrument: str, unit: str) -> RLock:
+        with self._locks_lock:
+            return self._series_locks.setdefault((instrument, unit), RLock())
+
+    def _generation_dir(self, instrument: str, unit: str) -> Optional[Path]:
+        """Returns the directory of the committed generation, None for an empty series."""
+        current_path = self.series_dir(instrument, unit) / self.__class__.CURRENT_FILE_NAME
+        if not current_path.is_file():
+            return None
+        return self.series_dir(instrument, unit) / current_path.read_text().strip()
+
+    def _column_path(self, generation_dir: Path, column: str) -> Path:
+        return generation_dir / f"{column}{self.__class__.COLUMN_SUFFIX}"
+
+    @classmethod
+    def _empty_columns(cls) -> Dict[str, array]:
+        return {col: array(cls.COLUMN_TYPECODES[col]) for col in cls.COLUMNS}
+
+    @classmethod
+    def rows_to_columns(cls, rows: Iterable[Dict[str, Any]]) -> Dict[str, array]:
+        """Converts API rows (dicts keyed on column name) into typed column arrays."""
+        columns = cls._empty_columns()
+        for row in rows:
+            for col in cls.COLUMNS:
+                columns[col].append(row[col])
+        return columns
+
+    @staticmethod
+    def _atomic_write(path: Path, payload: bytes) -> None:
+        """Writes to a temporary file first so a crash never leaves a half written file."""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(path.name + '.tmp')
+        with open(tmp_path, 'wb') as f:
+            f.write(payload)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+
+    def _aligned_row_count(self, generation_dir: Optional[Path], truncate: bool = False) -> int:
+        """
+        Returns the number of complete rows, i.e. the length of the shortest column.
+
+        An interrupted append can leave some columns longer than others; with truncate,
+        the longer column files are cut back so the next append starts aligned.
+        """
+        if generation_dir is None:
+            return 0
+        sizes = {}
+        for col in self.__class__.COLUMNS:
+            path = self._column_path(generation_dir, col)
+            sizes[col] = path.stat().st_size if path.is_file() else 0
+        row_count = min(sizes.values()) // self.__class__.ITEM_SIZE
+        if truncate:
+            for col, size in sizes.items():
+                if size > row_count * self.__class__.ITEM_SIZE:
+                    os.truncate(self._column_path(generation_dir, col), row_count * self.__class__.ITEM_SIZE)
+        return row_count
+
+    def read(self, instrument: str, unit: str = None) -> Dict[str, array]:
+        """
+        Reads a stored series.
+
+        If a previous append was interrupted, the columns can have different lengths;
+        every column is truncated to the shortest one so rows stay aligned.
+        """
+        unit = unit or self.__class__.DEFAULT_UNIT
+        columns = self._empty_columns()
+        with self._series_lock(instrument, unit):
+            generation_dir = self._generation_dir(instrument, unit)
+            row_count = self._aligned_row_count(generation_dir)
+            if row_count:
+                for col, values in columns.items():
+                    with open(self._column_path(generation_dir, col), 'rb') as f:
+                        values.frombytes(f.read(row_count * values.itemsize))
+        return columns
+
+    def last_row(self, instrument: str, unit: str = None) -> Optional[Dict[str, float | int]]:
+        """Returns the last stored row, reading only the end of each column file."""
+        unit = unit or self.__class__.DEFAULT_UNIT
+        key = (instrument, unit)
+        with self._series_lock(instrument, unit):
+            if key not in self._last_rows:
+                generation_dir = self._generation_dir(instrument, unit)
+                row_count = self._aligned_row_count(generation_dir)
+                last_row = None
+                if row_count:
+                    last_row = {}
+                    for col in self.__class__.COLUMNS:
+                        value = array(self.__class__.COLUMN_TYPECODES[col])
+                        with open(self._column_path(generation_dir, col), 'rb') as f:
+                            f.seek((row_count - 1) * value.itemsize)
+                            value.frombytes(f.read(value.itemsize))
+                        last_row[col] = value[0]
+                self._last_rows[key] = last_row
+            return self._last_rows[key]
+
+    def last_timestamp(self, instrument: str, unit: str = None) -> Optional[int]:
+        last_row = self.last_row(instrument, unit)
+        return last_row[self.__class__.TIMESTAMP_COLUMN] if last_row else None
+
+    def write(self, instrument: str, columns: Dict[str, array], unit: str = None) -> None:
+        """
+        Replaces a stored series with the given columns.
+
+        The columns are written to a new generation directory, which is committed by
+        atomically replacing CURRENT; older generations are removed afterwards.
+        """
+        unit = unit or self.__class__.DEFAULT_UNIT
+        series_dir = self.series_dir(instrument, unit)
+        with self._series_lock(instrument, unit):
+            self._last_rows.pop((instrument, unit), None)
+            current_dir = self._generation_dir(instrument, unit)
+            generation = 0
+            if current_dir is not None:
+                generation = int(current_dir.name[len(self.__class__.GENERATION_PREFIX):]) + 1
+            generation_dir = series_dir / f"{self.__class__.GENERATION_PREFIX}{generation}"
+            if generation_dir.exists():
+                # left behind by a rewrite that crashed before its commit
+                shutil.rmtree(generation_dir)
+            for col in self.__class__.COLUMNS:
+                self._atomic_write(self._column_path(generation_dir, col), columns[col].tobytes())
+
+            self._atomic_write(series_dir / self.__class__.CURRENT_FILE_NAME, generation_dir.name.encode())
+
+            for path in series_dir.glob(f"{self.__class__.GENERATION_PREFIX}*"):
+                if path != generation_dir:
+                    shutil.rmtree(path)
+
+    def append(self, instrument: str, columns: Dict[str, array], unit: str = None) -> None:
+        """
+        Appends rows to a stored series.
+
+        Rows that are not newer than the last stored (or previously appended) timestamp
+        are dropped, so the series stays sorted and free of duplicates.
+        """
+        unit = unit or self.__class__.DEFAULT_UNIT
+        key = (instrument, unit)
+        with self._series_lock(instrument, unit):
+            generation_dir = self._generation_dir(instrument, unit)
+            if generation_dir is None:
+                self.write(instrument, self._empty_columns(), unit)
+                generation_dir = self._generation_dir(instrument, unit)
+            if key not in self._last_rows:
+                # first append to this series in this process: undo any torn append first
+                self._aligned_row_count(generation_dir, truncate=True)
+            last_row = self.last_row(instrument, unit)
+            last_ts = last_row[self.__class__.TIMESTAMP_COLUMN] if last_row else None
+
+            keep = []
+            for i, ts in enumerate(columns[self.__class__.TIMESTAMP_COLUMN]):
+                if last_ts is None or ts > last_ts:
+                    keep.append(i)
+                    last_ts = ts
+            if not keep:
+                return
+
+            try:
+                for col in self.__class__.COLUMNS:
+                    new_values = array(self.__class__.COLUMN_TYPECODES[col], (columns[col][i] for i in keep))
+                    with open(self._column_path(generation_dir, col), 'ab') as f:
+                        f.write(new_values.tobytes())
+            except BaseException:
+                # the files may now be torn; the next append re-aligns them
+                self._last_rows.pop(key, None)
+                raise
+            self._last_rows[key] = {col: columns[col][keep[-1]] for col in self.__class__.COLUMNS}
+
+    def _update_last_row(self, instrument: str, unit: str, row: Dict[str, float | int]) -> None:
+        """Overwrites the price columns of the last stored row in place."""
+        key = (instrument, unit)
+        generation_dir = self._generation_dir(instrument, unit)
+        offset = (self._aligned_row_count(generation_dir) - 1) * self.__class__.ITEM_SIZE
+        try:
+            for col in self.__class__.PRICE_COLUMNS:
+                with open(self._column_path(generation_dir, col), 'r+b') as f:
+                    f.seek(offset)
+                    f.write(array(self.__class__.COLUMN_TYPECODES[col], [row[col]]).tobytes())
+        except BaseException:
+            self._last_rows.pop(key, None)
+            raise
+        self._last_rows[key] = row
+
+    def append_tick(self, instrument: str, timestamp: float, value: float, unit: str = None) -> None:
+        """
+        Rolls a live tick into the bar of `unit` (default: live_unit) it falls in.
+
+        A tick in the same bar as the last stored row updates its high, low and close;
+        a tick in a later bar starts a new row; ticks older than the last bar are dropped.
+        """
+        unit = unit or self.live_unit
+        self._check_unit(unit)
+        unit_seconds = self.__class__.UNIT_SECONDS[unit]
+        bar_ts = int(timestamp) - (int(timestamp) % unit_seconds)
+        value = float(value)
+        with self._series_lock(instrument, unit):
+            last_row = self.last_row(instrument, unit)
+            last_ts = last_row[self.__class__.TIMESTAMP_COLUMN] if last_row else None
+            if last_ts is not None and bar_ts < last_ts:
+                return
+            if last_ts == bar_ts:
+                self._update_last_row(instrument, unit, {
+                    **last_row,
+                    'HIGH': max(last_row['HIGH'], value),
+                    'LOW': min(last_row['LOW'], value),
+                    'CLOSE': value
+                })
+                return
+            row = {self.__class__.TIMESTAMP_COLUMN: bar_ts,
+                   **{col: value for col in self.__class__.PRICE_COLUMNS}}
+            self.append(instrument, self.__class__.rows_to_columns([row]), unit)
+
+    def chunk_ranges(self, instrument: str, unit: str = None) -> List[tuple[int, int]]:
+        """Returns the (from_ts, to_ts) ranges of the pending chunks of a series."""
+        ranges = []
+        for path in self.chunk_dir(instrument, unit).glob(f"*{self.__class__.CHUNK_SUFFIX}"):
+            from_ts, to_ts = path.stem.split('_')
+            ranges.append((int(from_ts), int(to_ts)))
+        return ranges
+
+    def write_chunk(self, instrument: str, unit: str, from_ts: int, to_ts: int,
+                    columns: Dict[str, array]) -> None:
+        """Persists one fetched page so it survives an interruption before the merge."""
+        row_count = len(columns[self.__class__.TIMESTAMP_COLUMN])
+        payload = self.__class__.CHUNK_HEADER.pack(row_count) + b''.join(
+            columns[col].tobytes() for col in self.__class__.COLUMNS)
+        self._atomic_write(self._chunk_path(instrument, unit, from_ts, to_ts), payload)
+
+    def _read_chunk(self, path: Path) -> Dict[str, array]:
+        raw = path.read_bytes()
+        (row_count,) = self.__class__.CHUNK_HEADER.unpack_from(raw)
+        offset = self.__class__.CHUNK_HEADER.size
+        columns = self._empty_columns()
+        for col, values in columns.items():
+            size = row_count * values.itemsize
+            values.frombytes(raw[offset:offset + size])
+            offset += size
+        return columns
+
+    @classmethod
+    def _merge_sorted(cls, old: Dict[str, array], new: Dict[str, array]) -> Dict[str, array]:
+        """
+        Merges two sorted, de-duplicated series; rows of new win on equal timestamps.
+
+        Only the part of old that overlaps new is merged row by row, the rest is copied
+        as whole array slices.
+        """
+        old_ts, new_ts = old[cls.TIMESTAMP_COLUMN], new[cls.TIMESTAMP_COLUMN]
+        if not new_ts:
+            return old
+        lo = bisect_left(old_ts, new_ts[0])
+        hi = bisect_right(old_ts, new_ts[-1])
+
+        window = []
+        i, j = lo, 0
+        while i < hi or j < len(new_ts):
+            if j == len(new_ts) or (i < hi and old_ts[i] < new_ts[j]):
+                window.append((old, i))
+                i += 1
+            else:
+                if i < hi and old_ts[i] == new_ts[j]:
+                    i += 1
+                window.append((new, j))
+                j += 1
+
+        return {col: old[col][:lo]
+                + array(cls.COLUMN_TYPECODES[col], (source[col][index] for source, index in window))
+                + old[col][hi:]
+                for col in cls.COLUMNS}
+
+    def merge_chunks(self, instrument: str, unit: str = None) -> int:
+        """
+        Merges all pending chunks into the stored series and removes them.
+
+        When all fetched rows are newer than the series they are simply appended,
+        otherwise the series is rewritten as a new generation. Chunks are only removed
+        once the merged data is committed.
+
+        Returns:
+            The number of rows in the series after the merge.
+        """
+        unit = unit or self.__class__.DEFAULT_UNIT
+        with self._series_lock(instrument, unit):
+            chunk_paths = sorted(self.chunk_dir(instrument, unit).glob(f"*{self.__class__.CHUNK_SUFFIX}"),
+                                 key=lambda path: tuple(int(ts) for ts in path.stem.split('_')))
+            if chunk_paths:
+                # chunks of the same page from different runs can overlap; later ones win
+                new = self._empty_columns()
+                for path in chunk_paths:
+                    new = self._merge_sorted(new, self._read_chunk(path))
+
+                last_ts = self.last_timestamp(instrument, unit)
+                new_ts = new[self.__class__.TIMESTAMP_COLUMN]
+                if last_ts is None or not new_ts or new_ts[0] > last_ts:
+                    self.append(instrument, new, unit)
+                else:
+                    self.write(instrument, self._merge_sorted(self.read(instrument, unit), new), unit)
+                for path in chunk_paths:
+                    path.unlink()
+            return self._aligned_row_count(self._generation_dir(instrument, unit))
+
+
+class HistoricalBackfill:
+    """
+    Backfills a HistoricalStore from the CoinDesk historical index endpoints.
+
+    The requested range is split into pages on a fixed grid of `limit` units counted from
+    the epoch, so page boundaries do not depend on the requested start or end. Pages are
+    fetched in parallel by a bounded thread pool and written to the store as chunks as
+    soon as they arrive. Pages already covered by a pending chunk or by the stored series
+    are skipped, so re-running a backfill only fetches what is missing. The last stored
+    row never counts as covered, since it may be a bar the live ticker is still filling.
+    """
+    BASE_URL: str = 'https://data-api.coindesk.com'
+    ENDPOINT_TEMPLATE: str = '/index/cc/v1/historical/{unit}'
+
+    UNIT_SECONDS: Dict[str, int] = HistoricalStore.UNIT_SECONDS
+    MAX_LIMIT: int = 2000
+    DEFAULT_MAX_WORKERS: int = 4
+    MAX_RETRIES: int = 3
+    RETRY_BACKOFF_SECONDS: float = 1.0
+    REQUEST_TIMEOUT_SECONDS: float = 30
+
+    KEY_DATA: str = 'Data'
+    KEY_ERR: str = 'Err'
+
+    DEFAULT_PARAMS: Dict[str, str] = {
+        "market": "cadli",
+        "groups": "ID,OHLC",
+        "fill": "true",
+        "apply_mapping": "true",
+        "response_format": "JSON"
+    }
+
+    def __init__(self, store: HistoricalStore, unit: str = 'days',
+                 max_workers: int = None, base_url: str = None, **kwargs) -> None:
+        """
+        Initialize the backfill.
+
+        Args:
+            store: HistoricalStore the fetched data is written to
+            unit: One of 'days', 'hours' or 'minutes'
+            max_workers: Maximum number of concurrent requests
+            base_url: Optional base URL for the API
+        """
+        if unit not in self.__class__.UNIT_SECONDS:
+            raise ValueError(f"unit must be one of: {', '.join(self.__class__.UNIT_SECONDS)}")
+        self.store = store
+        self.unit = unit
+        self.max_workers = max_workers or self.__class__.DEFAULT_MAX_WORKERS
+        self.url = (base_url or self.__class__.BASE_URL) + self.__class__.ENDPOINT_TEMPLATE.format(unit=unit)
+        self.limit = kwargs.get('limit', self.__class__.MAX_LIMIT)
+        self.verbose = kwargs.get('verbose', True)
+
+    @property
+    def unit_seconds(self) -> int:
+        return self.__class__.UNIT_SECONDS[self.unit]
+
+    def _align(self, timestamp: float) -> int:
+        """Floors a timestamp to the start of its unit."""
+        return int(timestamp) - (int(timestamp) % self.unit_seconds)
+
+    def plan_chunks(self, start: datetime, end: datetime) -> List[tuple[int, int]]:
+        """
+        Splits [start, end] into pages on the fixed page grid.
+
+        Returns:
+            A list of (from_ts, to_ts) pairs, oldest page first. The first and last
+            pages are clipped to the requested range.
+        """
+        start_ts = self._align(start.timestamp())
+        end_ts = self._align(end.timestamp())
+        if end_ts < start_ts:
+            raise ValueError("end must not be before start")
+
+        page_seconds = self.limit * self.unit_seconds
+        chunks = []
+        page_start = start_ts - (start_ts % page_seconds)
+        while page_start <= end_ts:
+            page_end = page_start + page_seconds - self.unit_seconds
+            chunks.append((max(page_start, start_ts), min(page_end, end_ts)))
+            page_start += page_seconds
+        return chunks
+
+    def _is_covered(self, from_ts: int, to_ts: int, chunk_ranges: List[tuple[int, int]],
+                    stored_timestamps: array) -> bool:
+        """Checks whether a page is already in a pending chunk or fully in the stored series."""
+        if any(c_from <= from_ts and c_to >= to_ts for c_from, c_to in chunk_ranges):
+            return True
+        expected_rows = (to_ts - from_ts) // self.unit_seconds + 1
+        stored_rows = (bisect_right(stored_timestamps, to_ts)
+                       - bisect_left(stored_timestamps, from_ts))
+        return stored_rows >= expected_rows
+
+    def fetch_chunk(self, instrument: str, from_ts: int, to_ts: int) -> List[Dict[str, Any]]:
+        """Fetches one page of history, retrying transient failures with a linear backoff."""
+        params = {**self.__class__.DEFAULT_PARAMS,
+                  "market": self.store.market,
+                  "instrument": instrument,
+                  "to_ts": str(to_ts),
+                  "limit": str((to_ts - from_ts) // self.unit_seconds + 1)}
+        last_error = None
+        for attempt in range(1, self.__class__.MAX_RETRIES + 1):
+            try:
+                response = r_get(self.url, params=params, timeout=self.__class__.REQUEST_TIMEOUT_SECONDS)
+                if not response.ok:
+                    raise CoinDeskApiError(f'API request failed: {response.status_code} - {response.reason}')
+                return self._parse_chunk(response.json())
+            except (CoinDeskApiError, RequestException) as e:
+                last_error = e
+                if attempt < self.__class__.MAX_RETRIES:
+                    sleep(self.__class__.RETRY_BACKOFF_SECONDS * attempt)
+        raise CoinDeskApiError(f"Failed to fetch {instrument} up to {to_ts} "
+                               f"after {self.__class__.MAX_RETRIES} attempts: {last_error}")
+
+    @classmethod
+    def _parse_chunk(cls, data: Dict[str, Any]) -> List[Dict[str, Any]]:
+        err = data.get(cls.KEY_ERR)
+        if err:
+            raise CoinDeskApiError(f"API returned an error: {err}")
+        try:
+            return data[cls.KEY_DATA]
+        except KeyError as e:
+            raise CoinDeskApiError(f"Missing required data field: {e}")
+
+    def _fetch_and_store(self, instrument: str, from_ts: int, to_ts: int) -> int:
+        rows = self.fetch_chunk(instrument, from_ts, to_ts)
+        try:
+            columns = HistoricalStore.rows_to_columns(rows)
+        except (KeyError, TypeError) as e:
+            raise CoinDeskApiError(f"Malformed row for {instrument} up to {to_ts}: {e!r}")
+        self.store.write_chunk(instrument, self.unit, from_ts, to_ts, columns)
+        return len(rows)
+
+    def backfill(self, instruments: List[CryptoType | str],
+                 start: datetime, end: datetime = None) -> Dict[str, int]:
+        """
+        Backfills the given instruments between start and end (default: now).
+
+        Args:
+            instruments: CryptoTypes or instrument keys such as 'BTC-USD'
+            start: Start of the range
+            end: End of the range
+
+        Returns:
+            Dictionary of instrument key to the number of stored rows.
+
+        Raises:
+            BackfillError: If any page of an instrument could not be fetched. Instruments
+                whose pages all succeeded are still merged; fetched pages of the failed
+                ones are kept, so the backfill can simply be run again.
+        """
+        end = end or datetime.now(timezone.utc)
+        instrument_keys = [i.instrument_key if isinstance(i, CryptoType) else i for i in instruments]
+        chunks = self.plan_chunks(start, end)
+
+        pending = []
+        for instrument in instrument_keys:
+            chunk_ranges = self.store.chunk_ranges(instrument, self.unit)
+            stored_timestamps = self.store.read(instrument, self.unit)[HistoricalStore.TIMESTAMP_COLUMN][:-1]
+            pending.extend((instrument, from_ts, to_ts) for from_ts, to_ts in chunks
+                           if not self._is_covered(from_ts, to_ts, chunk_ranges, stored_timestamps))
+        if self.verbose:
+            print(f"Backfilling {len(pending)} of {len(chunks) * len(instrument_keys)} pages "
+                  f"with {self.max_workers} workers")
+
+        failures: Dict[str, List[Exception]] = {}
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = {executor.submit(self._fetch_and_store, *job): job for job in pending}
+            for future in as_completed(futures):
+                instrument, _, to_ts = futures[future]
+                try:
+                    row_count = future.result()
+                    if self.verbose:
+                        print(f"{instrument}: {row_count} rows up to "
+                              f"{datetime.fromtimestamp(to_ts, timezone.utc).isoformat()}")
+                except CoinDeskApiError as e:
+                    failures.setdefault(instrument, []).append(e)
+
+        merged = {instrument: self.store.merge_chunks(instrument, self.unit)
+                  for instrument in instrument_keys if instrument not in failures}
+        if failures:
+            raise BackfillError(failures, merged)
+        return merged
+
+
+def _parse_date(value: str) -> datetime:
+    """Parses an ISO date, assuming UTC unless it has an explicit offset."""
+    parsed = datetime.fromisoformat(value)
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed
+
+
+if __name__ == '__main__':
+    parser = ArgumentParser(description='Backfill historical CoinDesk index data to local storage')
+    parser.add_argument('cryptos', nargs='*', help='cryptocurrencies to backfill (default: all supported)')
+    parser.add_argument('--start', required=True, type=_parse_date, help='start date, e.g. 2024-01-01')
+    parser.add_argument('--end', type=_parse_date, default=None, help='end date (default: now)')
+    parser.add_argument('--unit', default='days', choices=list(HistoricalBackfill.UNIT_SECONDS))
+    parser.add_argument('--workers', type=int, default=HistoricalBackfill.DEFAULT_MAX_WORKERS)
+    parser.add_argument('--data-dir', default='history')
+    args = parser.parse_args()
+
+    cryptos = [CryptoType.from_string(c) for c in args.cryptos] or list(CryptoType)
+    backfill = HistoricalBackfill(HistoricalStore(args.data_dir), unit=args.unit, max_workers=args.workers)
+    try:
+        print(backfill.backfill(cryptos, args.start, args.end))
+    except BackfillError as e:
+        print(e)
@@ -11,3 +11,15 @@ class UnsupportedCryptoError(Exception):
 class CoinDeskApiError(Exception):
     """Custom exception for Bitcoin API related errors"""
     pass
+
+
+class BackfillError(CoinDeskApiError):
+    """Raised when a backfill could not fetch every page of one or more instruments"""
+    def __init__(self, failures: dict[str, list[Exception]], merged: dict[str, int]):
+        self.failures = failures
+        self.merged = merged
+        failure_lines = "\n".join(f"\t{instrument}: {len(errors)} page(s) failed, first error: {errors[0]}"
+                                  for instrument, errors in self.failures.items())
+        self.message = (f"Backfill incomplete for {', '.join(self.failures)}, re-run to resume "
+                        f"(merged: {', '.join(self.merged) or 'none'}):\n{failure_lines}")
+        super().__init__(self.message)
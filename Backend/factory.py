@@ -1,11 +1,17 @@
-from typing import Dict, Type, Optional
+from collections import OrderedDict
+from threading import RLock
+from typing import Dict, Type, Optional, Tuple
+from weakref import WeakValueDictionary
+
+from requests import Session
 
 from CryptoPriceTickers import (BasePriceTicker, BitcoinPriceTicker,
                                   EthereumPriceTicker, LitecoinPriceTicker,
                                   RipplePriceTicker, DogePriceTicker)
 
+from Backend.backfill import HistoricalStore
 from Backend.err import UnsupportedCryptoError
-from Backend.helpers import CryptoType
+from Backend.helpers import CryptoType, CryptoColorizer
 
 
 class TickerFactory:
@@ -19,8 +25,58 @@ class TickerFactory:
     SUPPORTED_CRYPTO_TYPES = [crypto for crypto in TICKER_MAP.keys() if isinstance(crypto, CryptoType)]
     STRING_SUPPORTED_CRYPTO_TYPES = [str(x) for x in SUPPORTED_CRYPTO_TYPES]
 
-    def __init__(self):
-        self._ticker_instances = {}
+    def __init__(self, max_instances: Optional[int] = None, weak_refs: bool = False, **kwargs):
+        """
+        Args:
+            max_instances: Optional maximum number of pooled tickers,
+                the least recently used ticker is evicted first
+            weak_refs: If True, pooled tickers are evicted once nothing else references them
+            use_colorizer: Passed on to created tickers
+            history_store: Optional HistoricalStore created tickers record their prices in
+        """
+        if max_instances is not None and weak_refs:
+            raise ValueError("max_instances and weak_refs can not be combined")
+        self.max_instances = max_instances
+        self.weak_refs = weak_refs
+        self.use_colorizer = kwargs.get('use_colorizer', True)
+        self.history_store: Optional[HistoricalStore] = kwargs.get('history_store', None)
+        self._lock = RLock()
+        self._ticker_instances = WeakValueDictionary() if weak_refs else OrderedDict()
+        self._session = None
+        self._colorizer = None
+
+    @property
+    def session(self) -> Session:
+        """
+        requests.Session shared by all tickers created by this factory.
+
+        Tickers only issue GET requests through it, which is safe to do concurrently
+        (the connection pool is thread-safe); don't change its settings, headers or
+        cookies while tickers are in use from several threads.
+        """
+        with self._lock:
+            if self._session is None:
+                self._session = Session()
+            return self._session
+
+    @property
+    def colorizer(self) -> Optional[CryptoColorizer]:
+        """CryptoColorizer shared by all tickers created by this factory."""
+        with self._lock:
+            if self._colorizer is None and self.use_colorizer:
+                self._colorizer = CryptoColorizer()
+            return self._colorizer
+
+    @staticmethod
+    def _pool_key(crypto_type: CryptoType, params: Dict[str, str], base_url: Optional[str],
+                  history_store: Optional[HistoricalStore]) -> Tuple[CryptoType, Tuple[Tuple[str, str], ...],
+                                                                     Optional[str], Optional[HistoricalStore]]:
+        return crypto_type, tuple(sorted(params.items())), base_url, history_store
+
+    def clear_ticker_instances(self) -> None:
+        """Empties the ticker pool."""
+        with self._lock:
+            self._ticker_instances.clear()
 
     @classmethod
     def get_supported_cryptos(cls) -> list[CryptoType]:
@@ -36,25 +92,54 @@ class TickerFactory:
 
     def create_ticker(self, crypto_type: CryptoType,
                       params: Optional[Dict[str, str]] = None,
-                      force_new: bool = False) -> BasePriceTicker:
+                      force_new: bool = False,
+                      base_url: Optional[str] = None,
+                      history_store: Optional[HistoricalStore] = None) -> BasePriceTicker:
         """
         Creates or returns an existing ticker instance
 
+        Tickers are pooled on (crypto_type, params, base_url, history_store) and share this
+        factory's session and colorizer. Safe to call from multiple threads.
+
+        The same ticker is returned to every caller, so its price change is relative
+        to the previous call by any caller. Build one with get_ticker_class() for
+        a ticker that is not shared.
+
         Args:
             crypto_type: Type of cryptocurrency
             params: Optional API parameters
-            force_new: If True, always creates new instance
+            force_new: If True, always creates new instance (replacing the pooled one)
+            base_url: Optional base URL for the API
+            history_store: Optional HistoricalStore the ticker records its prices in,
+                defaults to the factory's history_store
         """
-        if not force_new and crypto_type in self._ticker_instances:
-            return self._ticker_instances[crypto_type]
-
         ticker_class = self.get_ticker_class(crypto_type)
         if params is None:
             params = {
                 "market": "cadli",  # Adding the required market parameter
                 "instruments": crypto_type.instrument_key
             }
-        return ticker_class(params=params)
+        history_store = history_store or self.history_store
+        key = self._pool_key(crypto_type, params, base_url, history_store)
+
+        with self._lock:
+            ticker = None if force_new else self._ticker_instances.get(key)
+            if ticker is not None:
+                if not self.weak_refs:
+                    self._ticker_instances.move_to_end(key)
+                return ticker
+
+            # copy params so callers mutating their dict can't desync the pool key
+            ticker = ticker_class(params=dict(params), base_url=base_url,
+                                  session=self.session, colorizer=self.colorizer,
+                                  use_colorizer=self.use_colorizer, history_store=history_store)
+            self._ticker_instances[key] = ticker
+            if not self.weak_refs:
+                self._ticker_instances.move_to_end(key)
+                if self.max_instances is not None:
+                    while len(self._ticker_instances) > self.max_instances:
+                        self._ticker_instances.popitem(last=False)
+            return ticker
 
     def print_all_crypto_formatted_price(self):
         all_cryptos = self.__class__.get_supported_cryptos()
@@ -1,4 +1,5 @@
 from re import findall
+from threading import RLock
 from typing import Dict, Any, Optional
 from datetime import datetime, timezone, timedelta
 from requests import get as r_get
@@ -38,6 +39,8 @@ class BasePriceTicker:
     INSTRUMENT_KEY = None
 
     CONTINUOUS_CHECK_INTERVAL_SECONDS: int = 5
+    # None waits on the API indefinitely
+    REQUEST_TIMEOUT_SECONDS: Optional[float] = None
 
     def __init__(self, params: Dict[str, str] = None, base_url: str = None, **kwargs) -> None:
         """
@@ -46,15 +49,24 @@ class BasePriceTicker:
         Args:
             params: Optional API request parameters
             base_url: Optional base URL for the API
+            history_store: Optional HistoricalStore every fetched price is rolled into
+            request_timeout: Optional timeout in seconds for API requests
+            session: Optional requests.Session used for API requests, can be shared between tickers
+            colorizer: Optional CryptoColorizer, can be shared between tickers
         """
         self._old_price = None
+        # guards the fetch and _old_price update, so a shared ticker's price change is consistent
+        self._lock = RLock()
         print(f"{'-'* 10} Initializing {self} {'-'* 10}")
         self._params = None
-        self.params = params or BasePriceTicker.DEFAULT_PARAMS
+        self.params = params or self.__class__.get_default_params()
         self.url = base_url or f"{BasePriceTicker.BASE_URL}{BasePriceTicker.ENDPOINT}"
         self.currency_shorthand = None
-        self._colorizer = None
+        self._colorizer = kwargs.get('colorizer', None)
+        self.session = kwargs.get('session', None)
         self.use_colorizer = kwargs.get('use_colorizer', True)
+        self.history_store = kwargs.get('history_store', None)
+        self.request_timeout = kwargs.get('request_timeout', self.__class__.REQUEST_TIMEOUT_SECONDS)
 
     def __str__(self):
         return f'{self.__class__.__name__} v{__version__}'
@@ -63,6 +75,14 @@ class BasePriceTicker:
     def get_crypto_name_string(cls):
         return findall('[A-Z][^A-Z]*', cls.__name__)[0].capitalize()
 
+    @classmethod
+    def get_default_params(cls) -> Dict[str, str]:
+        """Returns a copy of DEFAULT_PARAMS for this ticker's instrument."""
+        default_params = dict(cls.DEFAULT_PARAMS)
+        if cls.INSTRUMENT_KEY is not None:
+            default_params["instruments"] = cls.INSTRUMENT_KEY
+        return default_params
+
     @property
     def colorizer(self):
         if not self._colorizer:
@@ -107,18 +127,25 @@ class BasePriceTicker:
 
     @property
     def formatted_price(self) -> str:
-        """Returns a formatted string of the current Bitcoin price."""
-        price_info = self._parse_price_data(self.fetch_current_price())
+        """
+        Returns a formatted string of the current Bitcoin price.
+
+        Safe to call from several threads; calls on the same ticker are serialized, and
+        the price change is relative to the previous call on this ticker, whoever made it.
+        """
+        with self._lock:
+            price_data = self.fetch_current_price()
+            price_info = self._parse_price_data(price_data)
+            self._record_tick(price_data)
 
-        price_change = self._calculate_price_change(price_info)
+            price_change = self._calculate_price_change(price_info)
+            self._old_price = price_info['price_str']
 
         formatted_string = (f"As of {price_info['pretty_est_time']} EST:"
                             f"\n\t1 {self.currency_shorthand} = {price_info['price_str']} {price_change}")
         if self.use_colorizer:
             str_color = CryptoType.from_string(self.__class__.get_crypto_name_string()).get_color_for_crypto()
             formatted_string = self.colorizer.colorize(text=formatted_string, color=str_color)
-
-        self._old_price = price_info['price_str']
         return formatted_string
 
     def _calculate_price_change(self, current_price_info):
@@ -145,13 +172,23 @@ class BasePriceTicker:
 
     def fetch_current_price(self) -> Dict[str, Any]:
         """Fetches and returns current Bitcoin price information."""
-        response = r_get(self.url, params=self.params)
+        request_get = self.session.get if self.session is not None else r_get
+        response = request_get(self.url, params=self.params, timeout=self.request_timeout)
 
         if not response.ok:
             raise CoinDeskApiError(f'API request failed: {response.status_code} - {response.reason}')
 
         return response.json()
 
+    def _record_tick(self, data: Dict[str, Any], instrument_key=None) -> None:
+        """Rolls the fetched price into the history store's live_unit bars, if a store is configured."""
+        if self.history_store is None:
+            return
+        if instrument_key is None:
+            instrument_key = self.__class__.INSTRUMENT_KEY
+        coin_data, timestamp = self.get_currency_data(data, instrument_key)
+        self.history_store.append_tick(instrument_key, timestamp, coin_data[self.__class__.KEY_VALUE])
+
     @classmethod
     def _convert_to_est_time(cls, timestamp: float) -> datetime:
         """Converts Unix timestamp to EST timezone."""
@@ -14,7 +14,6 @@ class BitcoinPriceTicker(BasePriceTicker):
     INSTRUMENT_KEY = BasePriceTicker.KEY_BTC_USD
 
     def __init__(self, params: Dict[str, str] = None, base_url: str = None, **kwargs) -> None:
-        self.__class__.DEFAULT_PARAMS.update({"instruments": BasePriceTicker.KEY_BTC_USD})
         super().__init__(params, base_url, **kwargs)
         self.currency_shorthand = BasePriceTicker.KEY_BTC_USD.split('-')[0]
 
@@ -24,7 +23,6 @@ class EthereumPriceTicker(BasePriceTicker):
     INSTRUMENT_KEY = BasePriceTicker.KEY_ETH_USD
 
     def __init__(self, params: Dict[str, str] = None, base_url: str = None, **kwargs) -> None:
-        self.__class__.DEFAULT_PARAMS.update({"instruments": BasePriceTicker.KEY_ETH_USD})
         super().__init__(params, base_url, **kwargs)
         self.currency_shorthand = BasePriceTicker.KEY_ETH_USD.split('-')[0]
 
@@ -33,7 +31,6 @@ class LitecoinPriceTicker(BasePriceTicker):
     """A class to retrieve and process Litecoin price data from CoinDesk API."""
     INSTRUMENT_KEY = BasePriceTicker.KEY_LTC_USD
     def __init__(self, params: Dict[str, str] = None, base_url: str = None, **kwargs) -> None:
-        self.__class__.DEFAULT_PARAMS.update({"instruments": BasePriceTicker.KEY_LTC_USD})
         super().__init__(params, base_url, **kwargs)
         self.currency_shorthand = BasePriceTicker.KEY_LTC_USD.split('-')[0]
 
@@ -42,7 +39,6 @@ class RipplePriceTicker(BasePriceTicker):
     """A class to retrieve and process Ripple price data from CoinDesk API."""
     INSTRUMENT_KEY = BasePriceTicker.KEY_XRP_USD
     def __init__(self, params: Dict[str, str] = None, base_url: str = None, **kwargs) -> None:
-        self.__class__.DEFAULT_PARAMS.update({"instruments": BasePriceTicker.KEY_XRP_USD})
         super().__init__(params, base_url, **kwargs)
         self.currency_shorthand = BasePriceTicker.KEY_XRP_USD.split('-')[0]
 
@@ -50,7 +46,6 @@ class RipplePriceTicker(BasePriceTicker):
 class DogePriceTicker(BasePriceTicker):
     INSTRUMENT_KEY = BasePriceTicker.KEY_DOGE_USD
     def __init__(self, params: Dict[str, str] = None, base_url: str = None, **kwargs) -> None:
-        self.__class__.DEFAULT_PARAMS.update({"instruments": BasePriceTicker.KEY_DOGE_USD})
         super().__init__(params, base_url, **kwargs)
         self.currency_shorthand = BasePriceTicker.KEY_DOGE_USD.split('-')[0]
 
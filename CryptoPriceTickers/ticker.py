@@ -1,6 +1,7 @@
 from typing import Optional
 
 from MultiTicker.multi_ticker import MultiTicker
+from MultiTicker.supervisor import TickerSupervisor
 from Backend.factory import TickerFactory
 from Backend.helpers import CryptoType
 
@@ -8,7 +9,8 @@ from Backend.helpers import CryptoType
 class Ticker:
     MULTI_MODE = 'multi'
     FACTORY_MODE = 'factory'
-    VALID_MODES = [MULTI_MODE, FACTORY_MODE]
+    SUPERVISOR_MODE = 'supervisor'
+    VALID_MODES = [MULTI_MODE, FACTORY_MODE, SUPERVISOR_MODE]
     def __init__(self,  mode, factory: Optional[TickerFactory]=None, **kwargs):
         self._mode = None
 
@@ -22,6 +24,7 @@ class Ticker:
         self.base_url = kwargs.get('base_url', None)
         self.mode = mode
         self.use_colorizer = kwargs.get('use_colorizer', True)
+        self.history_store = kwargs.get('history_store', None)
         self.ticker = self._initialize_ticker()
 
     def _initialize_ticker(self):
@@ -29,9 +32,19 @@ class Ticker:
             initialized_ticker = MultiTicker(self.factory,
                                              crypto_types=self.crypto_type,
                                              params=self.params,
-                                             use_colorizer=self.use_colorizer)
+                                             use_colorizer=self.use_colorizer,
+                                             history_store=self.history_store)
+        elif self.mode == self.__class__.SUPERVISOR_MODE:
+            initialized_ticker = TickerSupervisor(self.factory,
+                                                  crypto_types=self.crypto_type,
+                                                  params=self.params,
+                                                  base_url=self.base_url,
+                                                  use_colorizer=self.use_colorizer,
+                                                  history_store=self.history_store)
         elif self.mode == self.__class__.FACTORY_MODE and self.crypto_type is not None:
-            initialized_ticker = self.factory.create_ticker(self.crypto_type, self.params)
+            initialized_ticker = self.factory.create_ticker(self.crypto_type, self.params,
+                                                             base_url=self.base_url,
+                                                             history_store=self.history_store)
         else:
             raise AttributeError('Invalid mode or crypto_type')
 
@@ -36,6 +36,9 @@ class MultiTicker(BasePriceTicker):
                 "instruments": ",".join(crypto.instrument_key for crypto in self.crypto_types)
             }
 
+        # Share the factory's transport and colorizer with the individual tickers
+        kwargs.setdefault('session', self.factory.session)
+        kwargs.setdefault('colorizer', self.factory.colorizer)
         super().__init__(params=params, base_url=base_url, **kwargs)
         self.currency_shorthand = "MULTI"
 
@@ -51,7 +54,7 @@ class MultiTicker(BasePriceTicker):
         print('-'* 50)
 
     def _format_price_line(self, price_data, crypto: CryptoType,
-                           not_first_line: bool = False):
+                           not_first_line: bool = False, colorize: bool = True):
         """
         Formats a line containing price information for a specific cryptocurrency.
 
@@ -66,12 +69,14 @@ class MultiTicker(BasePriceTicker):
             crypto: The cryptocurrency for which the price line is being formatted.
             not_first_line: Determines whether the line being formatted is the first line
                 (which includes a timestamp) or a subsequent line.
+            colorize: If False, the line is returned uncolored even with use_colorizer set.
 
         Returns:
             A string representing the formatted cryptocurrency price information.
         """
         parsed_data = self._parse_price_data(price_data,
                                              instrument_key=crypto.instrument_key)
+        self._record_tick(price_data, instrument_key=crypto.instrument_key)
         # print(parsed_data)
         price_change = self._calculate_price_change(parsed_data)
         # FIXME: where to set old price per crypto?
@@ -88,7 +93,7 @@ class MultiTicker(BasePriceTicker):
         # TODO: fix this?
         # self._old_price = line.split('\n')[-1].split('=')[1].strip().split()[0].split('$')[1]
 
-        if self.use_colorizer:
+        if colorize and self.use_colorizer:
             line = self.colorizer.colorize(
                 text=line,
                 color=crypto.get_color_for_crypto()
@@ -98,17 +103,22 @@ class MultiTicker(BasePriceTicker):
     @property
     def formatted_price(self) -> str:
         """Returns a formatted string of current prices for all cryptocurrencies."""
-        price_data = self.fetch_current_price()
         result = []
         not_first_line = False
 
-        for crypto, ticker in self.tickers.items():
-            formatted_line = self._format_price_line(price_data, crypto, not_first_line)
-            result.append(formatted_line)
+        with self._lock:
+            price_data = self.fetch_current_price()
+            for crypto, ticker in self.tickers.items():
+                formatted_line = self._format_price_line(price_data, crypto, not_first_line, colorize=False)
+                result.append((crypto, formatted_line))
 
-            not_first_line = True
+                not_first_line = True
 
-        return "\n".join(result)
+        # colorized outside the lock, like BasePriceTicker.formatted_price
+        if self.use_colorizer:
+            result = [(crypto, self.colorizer.colorize(text=line, color=crypto.get_color_for_crypto()))
+                      for crypto, line in result]
+        return "\n".join(line for _, line in result)
 
 
 # Usage example:
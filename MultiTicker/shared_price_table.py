@@ -0,0 +1,184 @@
+"""
+shared_price_table.py
+
+fixed layout price table in multiprocessing shared memory, written by ticker workers
+and readable by any local process without locks or IPC serialization
+"""
+import struct
+import sys
+from multiprocessing import resource_tracker
+from multiprocessing.shared_memory import SharedMemory
+from time import monotonic, sleep
+from typing import Dict, List, Optional
+
+
+class SharedPriceTable:
+    """
+    A table of (instrument, price, timestamp, delta) slots in shared memory.
+
+    Memory layout (little endian):
+        header: magic (8s), slot count (I), slot size (I)
+        slot:   sequence (Q), heartbeat (d), instrument (16s), price (d), timestamp (d), delta (d)
+
+    Each slot has exactly one writer. The writer makes the sequence odd, writes the
+    payload and makes it even again; readers retry while the sequence is odd or
+    changed during the read (a seqlock), so reads never need a lock.
+
+    The heartbeat is the writer's time.monotonic() at its last update attempt, successful
+    or not, and sits outside the seqlock so it shows liveness even while the API is down.
+    """
+    MAGIC: bytes = b'CPTABLE2'
+    HEADER = struct.Struct('<8sII')
+    SEQUENCE = struct.Struct('<Q')
+    HEARTBEAT = struct.Struct('<d')
+    PAYLOAD = struct.Struct('<16sddd')
+    PAYLOAD_OFFSET: int = SEQUENCE.size + HEARTBEAT.size
+    SLOT_SIZE: int = PAYLOAD_OFFSET + PAYLOAD.size
+    INSTRUMENT_MAX_LENGTH: int = 16
+
+    MAX_READ_RETRIES: int = 1000
+
+    def __init__(self, shm: SharedMemory, owner: bool = False) -> None:
+        self._shm = shm
+        self.owner = owner
+        magic, self.slot_count, slot_size = self.__class__.HEADER.unpack_from(self._shm.buf, 0)
+        if magic != self.__class__.MAGIC or slot_size != self.__class__.SLOT_SIZE:
+            raise ValueError(f"Shared memory block {self.name} is not a price table")
+
+    def __str__(self):
+        return f'{self.__class__.__name__}({self.name}, {self.slot_count} slots)'
+
+    @property
+    def name(self) -> str:
+        return self._shm.name
+
+    @classmethod
+    def create(cls, instruments: List[str], name: str = None) -> 'SharedPriceTable':
+        """
+        Creates a new table with one slot per instrument, in the given order.
+
+        Args:
+            instruments: Instrument keys, one slot each
+            name: Optional name of the shared memory block, a unique one is generated if None
+
+        Raises:
+            FileExistsError: If a shared memory block with that name already exists.
+        """
+        size = cls.HEADER.size + cls.SLOT_SIZE * len(instruments)
+        shm = SharedMemory(name=name, create=True, size=size)
+        cls.HEADER.pack_into(shm.buf, 0, cls.MAGIC, len(instruments), cls.SLOT_SIZE)
+        for index, instrument in enumerate(instruments):
+            encoded = instrument.encode()
+            if len(encoded) > cls.INSTRUMENT_MAX_LENGTH:
+                shm.close()
+                shm.unlink()
+                raise ValueError(f"Instrument key too long for the table: {instrument}")
+            offset = cls._slot_offset(index)
+            cls.SEQUENCE.pack_into(shm.buf, offset, 0)
+            cls.HEARTBEAT.pack_into(shm.buf, offset + cls.SEQUENCE.size, 0.0)
+            cls.PAYLOAD.pack_into(shm.buf, offset + cls.PAYLOAD_OFFSET, encoded, 0.0, 0.0, 0.0)
+        return cls(shm, owner=True)
+
+    @classmethod
+    def attach(cls, name: str, untrack: bool = True) -> 'SharedPriceTable':
+        """
+        Attaches to an existing table by name.
+
+        Args:
+            name: Name of the shared memory block
+            untrack: Stop the resource tracker from unlinking the block when this
+                process exits. Processes started by the table's owner share its
+                resource tracker and should pass False.
+        """
+        if sys.version_info >= (3, 13):
+            shm = SharedMemory(name=name, track=not untrack)
+        else:
+            shm = SharedMemory(name=name)
+            if untrack:
+                resource_tracker.unregister(shm._name, 'shared_memory')
+        return cls(shm)
+
+    @classmethod
+    def _slot_offset(cls, index: int) -> int:
+        return cls.HEADER.size + cls.SLOT_SIZE * index
+
+    def _check_index(self, index: int) -> int:
+        if not 0 <= index < self.slot_count:
+            raise IndexError(f"Slot {index} out of range for {self}")
+        return self.__class__._slot_offset(index)
+
+    def publish(self, index: int, price: float, timestamp: float, delta: float) -> None:
+        """Writes a slot. Must only be called by that slot's single writer."""
+        offset = self._check_index(index)
+        buf = self._shm.buf
+        (sequence,) = self.__class__.SEQUENCE.unpack_from(buf, offset)
+        # an odd sequence marks the slot as being written
+        self.__class__.SEQUENCE.pack_into(buf, offset, sequence + 1)
+        instrument = self.__class__.PAYLOAD.unpack_from(buf, offset + self.__class__.PAYLOAD_OFFSET)[0]
+        self.__class__.PAYLOAD.pack_into(buf, offset + self.__class__.PAYLOAD_OFFSET,
+                                         instrument, price, timestamp, delta)
+        self.__class__.SEQUENCE.pack_into(buf, offset, sequence + 2)
+
+    def beat(self, index: int) -> None:
+        """Records an update attempt for a slot. Must only be called by that slot's writer."""
+        offset = self._check_index(index)
+        self.__class__.HEARTBEAT.pack_into(self._shm.buf, offset + self.__class__.SEQUENCE.size, monotonic())
+
+    def heartbeat(self, index: int) -> float:
+        """Returns the time.monotonic() of the slot's last update attempt, 0.0 if there was none."""
+        offset = self._check_index(index)
+        return self.__class__.HEARTBEAT.unpack_from(self._shm.buf, offset + self.__class__.SEQUENCE.size)[0]
+
+    def repair(self, index: int) -> None:
+        """Makes an odd sequence left behind by a writer that died mid-publish even again."""
+        offset = self._check_index(index)
+        (sequence,) = self.__class__.SEQUENCE.unpack_from(self._shm.buf, offset)
+        if sequence % 2:
+            self.__class__.SEQUENCE.pack_into(self._shm.buf, offset, sequence + 1)
+
+    def read(self, index: int) -> Dict[str, float | str | int]:
+        """
+        Returns a consistent snapshot of one slot.
+
+        Raises:
+            TimeoutError: If no consistent snapshot could be read after MAX_READ_RETRIES.
+        """
+        offset = self._check_index(index)
+        buf = self._shm.buf
+        for _ in range(self.__class__.MAX_READ_RETRIES):
+            (before,) = self.__class__.SEQUENCE.unpack_from(buf, offset)
+            if before % 2:
+                sleep(0)
+                continue
+            instrument, price, timestamp, delta = self.__class__.PAYLOAD.unpack_from(
+                buf, offset + self.__class__.PAYLOAD_OFFSET)
+            (after,) = self.__class__.SEQUENCE.unpack_from(buf, offset)
+            if before == after:
+                return {
+                    'instrument': instrument.rstrip(b'\x00').decode(),
+                    'price': price,
+                    'timestamp': timestamp,
+                    'delta': delta,
+                    'sequence': before
+                }
+        raise TimeoutError(f"Could not read a consistent snapshot of slot {index} in {self}")
+
+    def sequence(self, index: int) -> int:
+        """Returns the slot's sequence counter, which grows by 2 with every publish."""
+        return self.__class__.SEQUENCE.unpack_from(self._shm.buf, self._check_index(index))[0]
+
+    def instruments(self) -> List[str]:
+        return [self.read(index)['instrument'] for index in range(self.slot_count)]
+
+    def index_of(self, instrument: str) -> Optional[int]:
+        instruments = self.instruments()
+        return instruments.index(instrument) if instrument in instruments else None
+
+    def snapshot(self) -> List[Dict[str, float | str | int]]:
+        return [self.read(index) for index in range(self.slot_count)]
+
+    def close(self) -> None:
+        """Detaches from the table; the owner also frees the shared memory block."""
+        self._shm.close()
+        if self.owner:
+            self._shm.unlink()
@@ -0,0 +1,284 @@
+"""
+supervisor.py
+
+runs ticker loops in worker processes, each handling a shard of the instruments,
+and publishes their prices into a SharedPriceTable
+"""
+import multiprocessing
+import multiprocessing.synchronize
+from time import monotonic, sleep
+from typing import Dict, List, Optional
+
+from requests import RequestException
+
+from CryptoPriceTickers import BasePriceTicker
+from Backend.backfill import HistoricalStore
+from Backend.err import CoinDeskApiError
+from Backend.factory import TickerFactory
+from Backend.helpers import CryptoColorizer, CryptoType
+from MultiTicker.shared_price_table import SharedPriceTable
+
+
+def _ticker_worker(table_name: str, slots: Dict[str, int], params: Dict[str, str],
+                   base_url: Optional[str], interval: float, request_timeout: Optional[float],
+                   stop_event, history_store_args: Optional[tuple[str, str, str]] = None) -> None:
+    """
+    Worker process entry point.
+
+    Fetches all instruments of its shard in one request every interval and publishes
+    price, timestamp and delta to the instruments' slots until stop_event is set.
+    Every attempt, failed or not, updates the slots' heartbeats. With history_store_args
+    (root_dir, market, live_unit), prices are also rolled into a HistoricalStore; each
+    instrument lives in exactly one shard, so every series still has a single writer.
+    """
+    table = SharedPriceTable.attach(table_name, untrack=False)
+    try:
+        # a predecessor may have died mid-write; this worker is now the slots' only writer
+        for index in slots.values():
+            table.repair(index)
+        last_prices = {instrument: table.read(index)['price'] or None
+                       for instrument, index in slots.items()}
+
+        history_store = HistoricalStore(*history_store_args) if history_store_args else None
+        ticker = BasePriceTicker(params=params, base_url=base_url, use_colorizer=False,
+                                 request_timeout=request_timeout, history_store=history_store)
+        while not stop_event.is_set():
+            try:
+                data = ticker.fetch_current_price()
+                for instrument, index in slots.items():
+                    coin_data, timestamp = ticker.get_currency_data(data, instrument)
+                    price = float(coin_data[BasePriceTicker.KEY_VALUE])
+                    last_price = last_prices[instrument]
+                    delta = 0.0 if last_price is None else price - last_price
+                    table.publish(index, price, float(timestamp), delta)
+                    last_prices[instrument] = price
+                    ticker._record_tick(data, instrument)
+            except (CoinDeskApiError, RequestException, KeyError, OSError) as e:
+                print(f"Worker for {', '.join(slots)} failed to update: {e}")
+            for index in slots.values():
+                table.beat(index)
+            stop_event.wait(interval)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        table.close()
+
+
+class TickerSupervisor:
+    """
+    Shards cryptocurrencies across worker processes that share one price table.
+
+    Each worker runs its own ticker loop, so a stuck request only stalls its own shard.
+    The supervisor restarts workers that exit, and workers that have not attempted an
+    update (see SharedPriceTable.heartbeat) for STALL_TIMEOUT_SECONDS. Failed fetches
+    still count as attempts, so an API outage does not cause restarts.
+
+    Every worker gets its own stop Event, which is discarded when the worker is
+    replaced: a process killed while waiting on an Event can leave it unusable.
+    """
+    WORKER_INTERVAL_SECONDS: float = BasePriceTicker.CONTINUOUS_CHECK_INTERVAL_SECONDS
+    SUPERVISE_INTERVAL_SECONDS: float = 1
+    STALL_TIMEOUT_SECONDS: float = 60
+    REQUEST_TIMEOUT_SECONDS: float = 10
+    STOP_TIMEOUT_SECONDS: float = 5
+
+    def __init__(self, factory: 'TickerFactory',
+                 crypto_types: Optional[List[CryptoType] | CryptoType] = None,
+                 num_workers: Optional[int] = None,
+                 params: Optional[Dict[str, str]] = None,
+                 base_url: str = None,
+                 **kwargs) -> None:
+        """
+        Initialize the supervisor.
+
+        Args:
+            factory: TickerFactory instance used to validate the crypto types
+            crypto_types: List of CryptoType to track. If None, tracks all supported types.
+            num_workers: Number of worker processes, at most one per crypto type.
+                Defaults to the CPU count.
+            params: Optional API parameters; "instruments" is set per worker
+            base_url: Optional base URL for the API
+            table_name: Optional name for the shared memory table. By default a unique
+                name is generated, available as table_name once started.
+            history_store: Optional HistoricalStore the workers record prices in
+        """
+        self.factory = factory
+        if isinstance(crypto_types, CryptoType):
+            crypto_types = [crypto_types]
+        self.crypto_types = crypto_types or factory.get_supported_cryptos()
+
+        # Validate all crypto types are supported
+        for crypto in self.crypto_types:
+            self.factory.get_ticker_class(crypto)  # Will raise UnsupportedCryptoError if not supported
+
+        num_workers = num_workers or multiprocessing.cpu_count()
+        self.num_workers = max(1, min(num_workers, len(self.crypto_types)))
+        self.shards = [self.crypto_types[i::self.num_workers] for i in range(self.num_workers)]
+
+        self.params = params or {"market": "cadli"}
+        self.base_url = base_url
+        self._table_name: Optional[str] = kwargs.get('table_name', None)
+        self.use_colorizer = kwargs.get('use_colorizer', True)
+        self.history_store: Optional[HistoricalStore] = kwargs.get('history_store', None)
+
+        self._context = multiprocessing.get_context()
+        self.table: Optional[SharedPriceTable] = None
+        self.workers: List[Optional[multiprocessing.Process]] = [None] * self.num_workers
+        self._stop_events: List[Optional[multiprocessing.synchronize.Event]] = [None] * self.num_workers
+        self._started_at: List[float] = [0.0] * self.num_workers
+        self._colorizer = None
+
+    def __str__(self):
+        return f'{self.__class__.__name__} ({self.num_workers} workers)'
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.stop()
+
+    @property
+    def colorizer(self):
+        if not self._colorizer:
+            if self.use_colorizer:
+                self._colorizer = CryptoColorizer()
+        return self._colorizer
+
+    @property
+    def table_name(self) -> Optional[str]:
+        """Name other processes pass to SharedPriceTable.attach to read the prices."""
+        return self.table.name if self.table is not None else self._table_name
+
+    @property
+    def _history_store_args(self) -> Optional[tuple[str, str, str]]:
+        """Picklable arguments the workers rebuild history_store from."""
+        if self.history_store is None:
+            return None
+        return str(self.history_store.root_dir), self.history_store.market, self.history_store.live_unit
+
+    def _slots_for_shard(self, shard_index: int) -> Dict[str, int]:
+        return {crypto.instrument_key: self.crypto_types.index(crypto)
+                for crypto in self.shards[shard_index]}
+
+    def _start_worker(self, shard_index: int) -> None:
+        slots = self._slots_for_shard(shard_index)
+        params = {**self.params, "instruments": ",".join(slots)}
+        stop_event = self._context.Event()
+        worker = self._context.Process(
+            target=_ticker_worker,
+            args=(self.table.name, slots, params, self.base_url,
+                  self.__class__.WORKER_INTERVAL_SECONDS, self.__class__.REQUEST_TIMEOUT_SECONDS,
+                  stop_event, self._history_store_args),
+            name=f"ticker-worker-{shard_index}",
+            daemon=True)
+        worker.start()
+        self.workers[shard_index] = worker
+        self._stop_events[shard_index] = stop_event
+        self._started_at[shard_index] = monotonic()
+
+    def start(self) -> None:
+        """Creates the shared price table and starts one worker per shard."""
+        if self.table is not None:
+            return
+        try:
+            self.table = SharedPriceTable.create([crypto.instrument_key for crypto in self.crypto_types],
+                                                 name=self._table_name)
+        except FileExistsError:
+            raise FileExistsError(f"A shared memory block named {self._table_name} already exists, "
+                                  f"another supervisor may be using it; pass a different table_name "
+                                  f"or leave it unset to generate a unique one") from None
+        print(f"{'-' * 10} Starting {self} on table {self.table.name} {'-' * 10}")
+        for shard_index in range(self.num_workers):
+            self._start_worker(shard_index)
+
+    def _is_stalled(self, shard_index: int) -> bool:
+        last_attempt = max([self._started_at[shard_index],
+                            *(self.table.heartbeat(index) for index in self._slots_for_shard(shard_index).values())])
+        return monotonic() - last_attempt >= self.__class__.STALL_TIMEOUT_SECONDS
+
+    def check_workers(self) -> List[int]:
+        """
+        Restarts workers that exited or stalled.
+
+        Returns:
+            The shard indices of the restarted workers.
+        """
+        if self.table is None:
+            return []
+        restarted = []
+        for shard_index, worker in enumerate(self.workers):
+            if not worker.is_alive():
+                print(f"{worker.name} exited with code {worker.exitcode}, restarting")
+            elif self._is_stalled(shard_index):
+                print(f"{worker.name} stalled for {self.__class__.STALL_TIMEOUT_SECONDS} seconds, restarting")
+                worker.terminate()
+                worker.join(self.__class__.STOP_TIMEOUT_SECONDS)
+            else:
+                continue
+            self._start_worker(shard_index)
+            restarted.append(shard_index)
+        return restarted
+
+    def stop(self) -> None:
+        """Stops all workers and frees the shared price table."""
+        if self.table is None:
+            return
+        for worker, stop_event in zip(self.workers, self._stop_events):
+            # a dead worker may have left its Event in a state where set() blocks
+            if worker.is_alive():
+                stop_event.set()
+        for worker in self.workers:
+            worker.join(self.__class__.STOP_TIMEOUT_SECONDS)
+            if worker.is_alive():
+                worker.terminate()
+                worker.join()
+        self.table.close()
+        self.table = None
+
+    @property
+    def formatted_price(self) -> str:
+        """Returns a formatted string of the latest prices in the shared table."""
+        result = []
+        for crypto, row in zip(self.crypto_types, self.table.snapshot()):
+            if not row['sequence']:
+                line = f"1 {crypto.value} = (waiting for first update)"
+            else:
+                pretty_est_time = BasePriceTicker._convert_to_est_time(row['timestamp']).ctime()
+                line = f"As of {pretty_est_time} EST: 1 {crypto.value} = ${row['price']:,.2f} ({row['delta']:+,.2f})"
+            if self.colorizer:
+                line = self.colorizer.colorize(text=line, color=crypto.get_color_for_crypto())
+            result.append(line)
+        return "\n".join(result)
+
+    def continuous_check(self) -> None:
+        """
+        Starts the workers and supervises them until interrupted by the user,
+        printing the shared price table every WORKER_INTERVAL_SECONDS.
+        """
+        self.start()
+        print(f"Supervising {len(self.crypto_types)} cryptocurrencies, "
+              f"press Ctrl+C to exit.")
+        last_printed = None
+        try:
+            while True:
+                self.check_workers()
+                if last_printed is None or monotonic() - last_printed >= self.__class__.WORKER_INTERVAL_SECONDS:
+                    print(self.formatted_price)
+                    print('-' * 50)
+                    last_printed = monotonic()
+                sleep(self.__class__.SUPERVISE_INTERVAL_SECONDS)
+        except KeyboardInterrupt:
+            print("Exiting...")
+        finally:
+            self.stop()
+
+
+# Usage example:
+if __name__ == '__main__':
+    # Create factory
+    factory = TickerFactory()
+
+    # Create supervisor with all supported cryptocurrencies
+    supervisor = TickerSupervisor(factory)
+    supervisor.continuous_check()
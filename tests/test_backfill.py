@@ -0,0 +1,193 @@
+from array import array
+from datetime import datetime, timezone, timedelta
+
+import pytest
+
+import Backend.backfill as backfill_module
+from Backend.backfill import HistoricalStore, HistoricalBackfill, _parse_date
+from Backend.err import BackfillError
+
+DAY = HistoricalStore.UNIT_SECONDS['days']
+START = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+
+class FakeResponse:
+    ok = True
+
+    def __init__(self, payload):
+        self.payload = payload
+
+    def json(self):
+        return self.payload
+
+
+class FakeApi:
+    """Stands in for r_get, serving one daily bar per requested unit with CLOSE == TIMESTAMP."""
+    def __init__(self, failing_instruments=(), malformed_instruments=()):
+        self.calls = []
+        self.failing_instruments = set(failing_instruments)
+        self.malformed_instruments = set(malformed_instruments)
+        self.failing_pages = set()
+
+    def __call__(self, url, params=None, timeout=None):
+        self.calls.append(params)
+        instrument = params['instrument']
+        if instrument in self.failing_instruments or int(params['to_ts']) in self.failing_pages:
+            return FakeResponse({'Err': {'message': 'no data'}})
+        to_ts, limit = int(params['to_ts']), int(params['limit'])
+        rows = [{'TIMESTAMP': to_ts - DAY * i, 'OPEN': 1.0, 'HIGH': 2.0, 'LOW': 0.5,
+                 'CLOSE': float(to_ts - DAY * i)} for i in reversed(range(limit))]
+        if instrument in self.malformed_instruments:
+            del rows[0]['CLOSE']
+        return FakeResponse({'Data': rows, 'Err': {}})
+
+
+@pytest.fixture
+def api(monkeypatch):
+    monkeypatch.setattr(HistoricalBackfill, 'RETRY_BACKOFF_SECONDS', 0)
+    fake_api = FakeApi()
+    monkeypatch.setattr(backfill_module, 'r_get', fake_api)
+    return fake_api
+
+
+@pytest.fixture
+def store(tmp_path):
+    return HistoricalStore(tmp_path)
+
+
+def _columns(timestamps, close):
+    return HistoricalStore.rows_to_columns(
+        {'TIMESTAMP': ts, 'OPEN': c, 'HIGH': c, 'LOW': c, 'CLOSE': c} for ts, c in zip(timestamps, close))
+
+
+def _column_file(store, instrument, column, unit='days'):
+    return store._column_path(store._generation_dir(instrument, unit), column)
+
+
+def test_crash_during_rewrite_keeps_previous_generation(store, monkeypatch):
+    store.append('BTC-USD', _columns([100, 200, 300, 400], [9.0] * 4))
+    store.write_chunk('BTC-USD', 'days', 100, 200, _columns([100, 200], [1.0, 2.0]))
+
+    original_atomic_write = HistoricalStore._atomic_write
+
+    def crash_on_open_column(path, payload):
+        if path.name == 'OPEN.bin':
+            raise OSError('simulated crash')
+        original_atomic_write(path, payload)
+
+    monkeypatch.setattr(HistoricalStore, '_atomic_write', staticmethod(crash_on_open_column))
+    with pytest.raises(OSError):
+        store.merge_chunks('BTC-USD')
+    monkeypatch.undo()
+
+    fresh_store = HistoricalStore(store.root_dir)
+    series = fresh_store.read('BTC-USD')
+    assert list(series['TIMESTAMP']) == [100, 200, 300, 400]
+    assert list(series['CLOSE']) == [9.0] * 4
+
+    fresh_store.merge_chunks('BTC-USD')
+    series = fresh_store.read('BTC-USD')
+    assert list(series['TIMESTAMP']) == [100, 200, 300, 400]
+    assert list(series['CLOSE']) == [1.0, 2.0, 9.0, 9.0]
+    assert fresh_store.chunk_ranges('BTC-USD', 'days') == []
+
+
+def test_torn_append_is_realigned(store):
+    store.append('BTC-USD', _columns([100, 200], [1.0, 2.0]))
+    with open(_column_file(store, 'BTC-USD', 'TIMESTAMP'), 'ab') as f:
+        f.write(array('q', [300]).tobytes())
+
+    fresh_store = HistoricalStore(store.root_dir)
+    fresh_store.append('BTC-USD', _columns([400], [4.0]))
+    series = fresh_store.read('BTC-USD')
+    assert list(series['TIMESTAMP']) == [100, 200, 400]
+    assert list(series['CLOSE']) == [1.0, 2.0, 4.0]
+
+
+def test_overlapping_chunks_are_deduplicated(store):
+    store.write_chunk('BTC-USD', 'days', 100, 300, _columns([100, 200, 300], [1.0, 2.0, 3.0]))
+    store.write_chunk('BTC-USD', 'days', 100, 400, _columns([100, 200, 300, 400], [1.0, 2.0, 3.5, 4.0]))
+    store.write_chunk('BTC-USD', 'days', 500, 500, _columns([500], [5.0]))
+
+    assert store.merge_chunks('BTC-USD') == 5
+    series = store.read('BTC-USD')
+    assert list(series['TIMESTAMP']) == [100, 200, 300, 400, 500]
+    assert list(series['CLOSE']) == [1.0, 2.0, 3.5, 4.0, 5.0]
+
+
+def test_merge_of_newer_rows_appends_without_rewrite(store):
+    store.append('BTC-USD', _columns([100, 200], [1.0, 2.0]))
+    generation_dir = store._generation_dir('BTC-USD', 'days')
+    store.write_chunk('BTC-USD', 'days', 300, 400, _columns([300, 400], [3.0, 4.0]))
+
+    assert store.merge_chunks('BTC-USD') == 4
+    assert store._generation_dir('BTC-USD', 'days') == generation_dir
+    assert list(store.read('BTC-USD')['CLOSE']) == [1.0, 2.0, 3.0, 4.0]
+
+
+def test_page_grid_does_not_depend_on_end(store):
+    backfill = HistoricalBackfill(store, unit='hours', limit=100, verbose=False)
+    end = datetime(2024, 1, 20, tzinfo=timezone.utc)
+    first_plan = backfill.plan_chunks(START, end)
+    later_plan = backfill.plan_chunks(START, end + timedelta(minutes=1))
+    assert first_plan == later_plan
+
+
+def test_backfill_resumes_and_skips_stored_pages(store, api):
+    backfill = HistoricalBackfill(store, limit=10, verbose=False)
+    end = START + timedelta(days=39)
+    pages = backfill.plan_chunks(START, end)
+    assert len(pages) > 2
+
+    api.failing_pages = {pages[1][1]}
+    with pytest.raises(BackfillError):
+        backfill.backfill(['BTC-USD'], START, end)
+    assert len(api.calls) == len(pages) - 1 + HistoricalBackfill.MAX_RETRIES
+
+    # the pages fetched before the failure are kept; only the failed one is fetched again
+    api.failing_pages = set()
+    api.calls.clear()
+    assert backfill.backfill(['BTC-USD'], START, end) == {'BTC-USD': 40}
+    assert [int(call['to_ts']) for call in api.calls] == [pages[1][1]]
+
+    # after the merge, only the page holding the last stored row is fetched again
+    api.calls.clear()
+    assert backfill.backfill(['BTC-USD'], START, end) == {'BTC-USD': 40}
+    assert [int(call['to_ts']) for call in api.calls] == [pages[-1][1]]
+
+    timestamps = store.read('BTC-USD')['TIMESTAMP']
+    assert timestamps[0] == START.timestamp()
+    assert all(b - a == DAY for a, b in zip(timestamps, timestamps[1:]))
+
+
+def test_failing_instrument_does_not_block_others(store, api):
+    api.failing_instruments = {'DOGE-USD'}
+    api.malformed_instruments = {'XRP-USD'}
+    backfill = HistoricalBackfill(store, limit=10, verbose=False)
+
+    with pytest.raises(BackfillError) as exc_info:
+        backfill.backfill(['BTC-USD', 'DOGE-USD', 'XRP-USD'], START, START + timedelta(days=19))
+
+    assert set(exc_info.value.failures) == {'DOGE-USD', 'XRP-USD'}
+    assert exc_info.value.merged == {'BTC-USD': 20}
+    assert len(store.read('BTC-USD')['TIMESTAMP']) == 20
+
+
+def test_live_ticks_extend_backfilled_bars(store, api):
+    HistoricalBackfill(store, limit=10, verbose=False).backfill(['BTC-USD'], START, START + timedelta(days=1))
+    next_day = START.timestamp() + 2 * DAY
+
+    store.append_tick('BTC-USD', next_day + 10, 5.0)
+    store.append_tick('BTC-USD', next_day + 20, 7.0)
+    store.append_tick('BTC-USD', next_day + 30, 3.0)
+    store.append_tick('BTC-USD', next_day + 40, 6.0)
+    store.append_tick('BTC-USD', START.timestamp(), 100.0)
+
+    series = HistoricalStore(store.root_dir).read('BTC-USD')
+    assert list(series['TIMESTAMP']) == [START.timestamp(), START.timestamp() + DAY, next_day]
+    assert [series[col][-1] for col in HistoricalStore.PRICE_COLUMNS] == [5.0, 7.0, 3.0, 6.0]
+
+
+def test_parse_date_keeps_explicit_offset():
+    assert _parse_date('2024-01-01') == START
+    assert _parse_date('2024-01-01T05:00+05:00') == START
@@ -0,0 +1,58 @@
+import pytest
+
+from Backend.factory import TickerFactory
+from Backend.helpers import CryptoType
+from MultiTicker.shared_price_table import SharedPriceTable
+from MultiTicker.supervisor import TickerSupervisor
+
+
+@pytest.fixture
+def supervisor_factory(monkeypatch):
+    # the tables are what is under test, not the workers
+    monkeypatch.setattr(TickerSupervisor, '_start_worker', lambda self, shard_index: None)
+    supervisors = []
+
+    def make_supervisor(**kwargs):
+        supervisor = TickerSupervisor(TickerFactory(), crypto_types=[CryptoType.BITCOIN, CryptoType.ETHEREUM],
+                                      num_workers=1, use_colorizer=False, **kwargs)
+        supervisors.append(supervisor)
+        return supervisor
+
+    yield make_supervisor
+    for supervisor in supervisors:
+        if supervisor.table is not None:
+            supervisor.table.close()
+
+
+def test_default_table_names_are_unique(supervisor_factory):
+    first, second = supervisor_factory(), supervisor_factory()
+    first.start()
+    second.start()
+    assert first.table_name != second.table_name
+
+    reader = SharedPriceTable.attach(first.table_name)
+    assert reader.instruments() == ['BTC-USD', 'ETH-USD']
+    reader.close()
+
+
+def test_taken_table_name_raises_clear_error(supervisor_factory):
+    first = supervisor_factory()
+    first.start()
+    second = supervisor_factory(table_name=first.table_name)
+    with pytest.raises(FileExistsError, match='table_name'):
+        second.start()
+    assert second.table is None
+
+
+def test_check_workers_before_start(supervisor_factory):
+    assert supervisor_factory().check_workers() == []
+
+
+def test_publish_and_read_round_trip():
+    table = SharedPriceTable.create(['BTC-USD'])
+    try:
+        table.publish(0, 100.0, 1700000000.0, 2.5)
+        row = table.read(0)
+        assert (row['instrument'], row['price'], row['delta'], row['sequence']) == ('BTC-USD', 100.0, 2.5, 2)
+    finally:
+        table.close()